@@ -3,14 +3,29 @@
 # It uses the Flask web framework to create endpoints that an AI agent can call to perform searches.
 # The server is designed with the principles of atomicity and clarity, providing distinct tools for specific search tasks.
 
+# --- Cooperative I/O ---
+# gevent must patch the standard library *before* anything else (notably `httpx`) is imported.
+# Once patched, every blocking socket call made while waiting on Tavily yields to other requests,
+# letting a single worker process serve many clients concurrently.
+from gevent import monkey
+monkey.patch_all()
+
 # --- Core Imports ---
 import os       # Used to securely access environment variables (like the API key).
-import json     # Used for handling JSON data, though Flask handles most of it automatically.
-from flask import Flask, request, jsonify  # Core components of the Flask framework.
-                                           # Flask: The main application object.
-                                           # request: Represents the incoming HTTP request.
-                                           # jsonify: Converts Python dictionaries to JSON responses.
-import requests # Used to make HTTP requests to the external Tavily API.
+import time     # Used to back off between retries of a failed Tavily call.
+import hashlib  # Used to fingerprint static responses so clients can cache them.
+import orjson   # A fast, C-backed JSON library used to serialize every response we send.
+import msgspec  # A fast, C-backed validation library used to check the parameters of each tool call.
+from typing import List
+from gevent.pool import Pool  # Runs the calls of a batch request concurrently.
+from gevent.lock import BoundedSemaphore  # Caps how many Tavily calls each worker makes at once.
+from gevent.event import AsyncResult  # Lets identical, simultaneous Tavily calls share a single result.
+from flask import Flask, request  # Core components of the Flask framework.
+                                  # Flask: The main application object.
+                                  # request: Represents the incoming HTTP request.
+from flask_caching import Cache  # Memoizes tool results so repeated queries skip the Tavily round-trip.
+from flask_compress import Compress  # Compresses responses before they are sent to the client.
+import httpx    # Used to make HTTP/2 requests to the external Tavily API.
 
 
 # --- Flask App Initialization ---
@@ -19,114 +34,329 @@ import requests # Used to make HTTP requests to the external Tavily API.
 app = Flask(__name__)
 
 
-# --- Tool Definition ---
-# This dictionary acts as a manifest or a "vocabulary" for the AI agent.
-# It clearly defines every tool the server offers, its purpose, and the Python function that executes it.
-# The "description" is critical, as it's what the AI uses to decide which tool to use for a given task.
-tools = {
-    # Tool #1: Standard Search
-    "search": {
-        "description": "Performs a standard, fast search using the Tavily AI search engine. Best for general queries and recent events.",
-        "function": "tavily_search"  # Maps this tool to the tavily_search() Python function.
-    },
-    # Tool #2: Deep Search
-    "deep_search": {
-        "description": "Performs a comprehensive, in-depth search using the Tavily AI search engine. Slower but more thorough. Use for research or complex topics.",
-        "function": "tavily_deep_search" # Maps to the tavily_deep_search() function.
-    },
-    # Tool #3: Get Direct Answer
-    "get_direct_answer": {
-        "description": "Searches for a direct, conversational answer to a user's question. Use this when the user asks a direct question like 'What is...?' or 'How do I...?'.",
-        "function": "tavily_get_direct_answer" # Maps to the tavily_get_direct_answer() function.
-    },
-    # Tool #4: Domain-Specific Search
-    "search_specific_domains": {
-        "description": "Performs a search focused only on a specific list of domains. Provide the query and a list of websites to search within.",
-        "function": "tavily_search_specific_domains" # Maps to the tavily_search_specific_domains() function.
-    }
-}
+# --- Response Compression ---
+# Search results are mostly text snippets, which compress very well. Brotli is preferred when the
+# client supports it, with gzip as the fallback; tiny responses aren't worth compressing.
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 512
+Compress(app)
+
+
+# --- JSON Responses ---
+def ojsonify(obj):
+    """
+    A drop-in replacement for Flask's `jsonify` that serializes with orjson.
+    Tavily responses can carry kilobytes of snippet text, so encoding speed matters on the response path.
+    """
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+# --- Result Cache ---
+# Identical queries are answered from the cache instead of calling (and paying for) Tavily again.
+# Redis is shared by every worker process; without REDIS_URL we fall back to a per-process in-memory cache.
+if os.environ.get("REDIS_URL"):
+    cache = Cache(app, config={
+        "CACHE_TYPE": "RedisCache",
+        "CACHE_REDIS_URL": os.environ["REDIS_URL"],
+        "CACHE_DEFAULT_TIMEOUT": 300,
+    })
+else:
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
+
+
+# --- Outbound HTTP Client ---
+# A single, shared client keeps its TLS connection to api.tavily.com alive between calls, so each tool
+# call reuses an open connection instead of paying for a fresh handshake. With HTTP/2, concurrent calls
+# are multiplexed over the same connection rather than each needing a socket of their own.
+_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    timeout=httpx.Timeout(30.0, connect=5.0),  # Never let a stalled connection hang the worker forever.
+)
+
+# Robustness: Rate limits and transient server errors are retried a few times, waiting a little longer
+# before each attempt (0.2s, 0.4s, 0.8s). Tavily searches are read-only, so retrying a POST is safe.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Security: Retrieve the API key from environment variables once at startup. This prevents hardcoding
+# secrets in the code and avoids re-reading the environment on every call.
+# Robustness: A missing or empty key stops the server at startup with a clear message,
+# instead of letting it answer every tool call with an error.
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
+if not TAVILY_API_KEY:
+    raise RuntimeError("TAVILY_API_KEY environment variable not set.")
+
+# The official Tavily API endpoint for searching.
+TAVILY_URL = "https://api.tavily.com/search"
+
+# Robustness: Limit how many calls to Tavily each worker has in flight at once. Under a burst, extra calls
+# wait their turn (up to TAVILY_QUEUE_TIMEOUT seconds) instead of flooding Tavily into rate-limiting us
+# and exhausting local sockets.
+_tavily_sem = BoundedSemaphore(int(os.environ.get("TAVILY_MAX_INFLIGHT", 20)))
+TAVILY_QUEUE_TIMEOUT = float(os.environ.get("TAVILY_QUEUE_TIMEOUT", 10))
+
+
+# --- Tool Parameter Schemas ---
+# Each schema describes the exact parameters a tool accepts. Incoming parameters are validated against
+# these before the tool runs, so malformed calls are rejected with a precise error message.
+# forbid_unknown_fields=True: an unexpected parameter is an error rather than being silently ignored.
+
+class SearchParams(msgspec.Struct, forbid_unknown_fields=True):
+    """Parameters for the tools that only take a search query."""
+    query: str
+
+class DomainSearchParams(msgspec.Struct, forbid_unknown_fields=True):
+    """Parameters for search_specific_domains: a query plus the websites to search within."""
+    query: str
+    domains: List[str]
 
 
 # --- Tool Implementation ---
 # This section contains the actual Python functions that perform the work for each tool.
 
-def _tavily_base_search(payload: dict):
+# Tavily calls currently in flight, keyed by their request body. See _tavily_base_search().
+_inflight = {}
+
+# Tavily request bodies are sent pre-encoded, so the Content-Type header must be set explicitly.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _tavily_base_search(body: bytes):
     """
     A private base function to handle all communications with the Tavily API.
-    This avoids code duplication by centralizing API key handling, request sending, and error management.
+    This avoids code duplication by centralizing request sending, concurrency limits, and error management.
+
+    Identical calls that arrive while one is already in flight don't go to Tavily again: they wait for
+    the first call and share its result. Greenlets only switch while waiting on I/O, so the bookkeeping
+    on `_inflight` below needs no lock.
 
     Args:
-        payload: A dictionary containing the specific parameters for the Tavily API call.
+        body: The complete JSON request body for the Tavily API call, built from a template (see below).
 
     Returns:
-        A dictionary with the API response or an error message.
+        A tuple of (JSON body as bytes, HTTP status code), as returned by _tavily_request().
     """
-    # Security: Retrieve the API key from environment variables. This prevents hardcoding secrets in the code.
-    api_key = os.environ.get("TAVILY_API_KEY")
-    if not api_key:
-        # Robustness: Gracefully handle the case where the API key is not configured.
-        return {"error": "TAVILY_API_KEY environment variable not set."}
+    # Every body is built from a fixed template, so identical calls always produce identical bytes
+    # and the body itself can serve as the key.
+    pending = _inflight.get(body)
+    if pending is not None:
+        # An identical call is already on its way; wait for its result instead of sending another.
+        return pending.get()
 
-    # Add the API key to the payload for every request.
-    payload["api_key"] = api_key
-    
-    # The official Tavily API endpoint for searching.
-    url = "https://api.tavily.com/search"
+    pending = _inflight[body] = AsyncResult()
+    try:
+        result = _tavily_request(body)
+        pending.set(result)
+        return result
+    except BaseException as e:
+        # Make sure any waiting callers see the failure too, rather than waiting forever.
+        pending.set_exception(e)
+        raise
+    finally:
+        del _inflight[body]
+
+def _tavily_request(body: bytes):
+    """
+    Sends a single request to the Tavily API.
+
+    Args:
+        body: The complete JSON request body, including the API key.
+
+    Returns:
+        A tuple of (JSON body as bytes, HTTP status code). On success the body is Tavily's response,
+        passed through untouched: we never need to inspect it, so decoding and re-encoding it would be wasted work.
+    """
+    # Wait for a free slot; if none opens up in time, the server is overloaded.
+    if not _tavily_sem.acquire(timeout=TAVILY_QUEUE_TIMEOUT):
+        # 503 Service Unavailable: the agent may retry later.
+        return orjson.dumps({"error": "Too many concurrent Tavily requests; try again later."}), 503
 
     try:
-        # Make the POST request to the Tavily API with the JSON payload.
-        response = requests.post(url, json=payload)
+        for attempt in range(_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                # Make the POST request to the Tavily API with the JSON body over the shared client.
+                response = _client.post(TAVILY_URL, content=body, headers=_JSON_HEADERS)
+            except httpx.TransportError:
+                # A network failure (e.g., connection reset or timeout): retry unless out of attempts.
+                if attempt == _MAX_RETRIES:
+                    raise
+                continue
+            if response.status_code not in _RETRY_STATUSES:
+                break
         # Raise an exception for HTTP error codes (e.g., 401 Unauthorized, 429 Rate Limit, 500 Server Error).
         response.raise_for_status()
-        # If the request was successful, return the JSON response from the API.
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # If the request was successful, return the raw JSON response from the API.
+        return response.content, response.status_code
+    except httpx.HTTPError as e:
         # Robustness: Catch any network or HTTP errors and return a clear error message.
-        return {"error": f"API request failed: {str(e)}"}
+        # 502 Bad Gateway: the failure happened upstream, not in the agent's request.
+        return orjson.dumps({"error": f"API request failed: {str(e)}"}), 502
+    finally:
+        # Always free the slot, whether the call succeeded or not.
+        _tavily_sem.release()
+
+def _is_cacheable(result):
+    """Only successful Tavily responses are cached; errors should be retried on the next call."""
+    _body, status = result
+    return status == 200
+
+# --- Payload Templates ---
+# Every tool sends the same fixed parameters (plus the API key) on each call; only the query and, for
+# domain search, the domain list vary. So each tool's request body is pre-encoded at import time up to
+# the query, and a call only has to encode its own arguments and append them.
+
+def _body_template(fixed: dict) -> bytes:
+    """Encodes `fixed` and the API key as an unterminated JSON object ending in `"query":`."""
+    # Drop the closing brace so that more fields can be appended.
+    return orjson.dumps({**fixed, "api_key": TAVILY_API_KEY})[:-1] + b',"query":'
+
+_TPL_SEARCH = _body_template({"search_depth": "basic", "max_results": 5})
+_TPL_DEEP_SEARCH = _body_template({"search_depth": "advanced", "max_results": 8})
+_TPL_DIRECT_ANSWER = _body_template({"include_answer": True})
+_TPL_DOMAINS = _body_template({"max_results": 5})
 
 # --- Public-Facing Tool Functions ---
+# Each tool is memoized on its arguments. Standard search is the tool for recent events, so its
+# results expire quickly; direct answers to factual questions change rarely and are kept longest.
 
+@cache.memoize(timeout=60, response_filter=_is_cacheable)
 def tavily_search(query: str):
     """Executes a standard Tavily search by setting 'search_depth' to 'basic'."""
-    payload = {"query": query, "search_depth": "basic", "max_results": 5}
-    return _tavily_base_search(payload)
+    return _tavily_base_search(_TPL_SEARCH + orjson.dumps(query) + b"}")
 
+@cache.memoize(timeout=300, response_filter=_is_cacheable)
 def tavily_deep_search(query: str):
     """Executes a deep Tavily search by setting 'search_depth' to 'advanced'."""
-    payload = {"query": query, "search_depth": "advanced", "max_results": 8}
-    return _tavily_base_search(payload)
+    return _tavily_base_search(_TPL_DEEP_SEARCH + orjson.dumps(query) + b"}")
 
+@cache.memoize(timeout=600, response_filter=_is_cacheable)
 def tavily_get_direct_answer(query: str):
     """Gets a direct answer by setting 'include_answer' to True."""
-    payload = {"query": query, "include_answer": True}
-    return _tavily_base_search(payload)
+    return _tavily_base_search(_TPL_DIRECT_ANSWER + orjson.dumps(query) + b"}")
 
 def tavily_search_specific_domains(query: str, domains: list):
     """Restricts a search to a list of domains via the 'include_domains' parameter."""
-    payload = {"query": query, "include_domains": domains, "max_results": 5}
-    return _tavily_base_search(payload)
+    # Normalize the domain list so that the same set of domains, in any order, hits the same cache entry.
+    return _tavily_search_specific_domains(query, tuple(sorted(domains)))
+
+@cache.memoize(timeout=300, response_filter=_is_cacheable)
+def _tavily_search_specific_domains(query: str, domains: tuple):
+    """The cached half of tavily_search_specific_domains(); expects an already-normalized domain tuple."""
+    body = _TPL_DOMAINS + orjson.dumps(query) + b',"include_domains":' + orjson.dumps(domains) + b"}"
+    return _tavily_base_search(body)
+
+
+# --- Tool Definition ---
+# This dictionary acts as a manifest or a "vocabulary" for the AI agent.
+# It clearly defines every tool the server offers, its purpose, and the Python function that executes it.
+# It is defined after the tool functions so that each entry can hold a direct reference to its function.
+# The "description" is critical, as it's what the AI uses to decide which tool to use for a given task.
+tools = {
+    # Tool #1: Standard Search
+    "search": {
+        "description": "Performs a standard, fast search using the Tavily AI search engine. Best for general queries and recent events.",
+        "function": tavily_search, # Maps this tool to the tavily_search() Python function.
+        "params": SearchParams # The schema its parameters are validated against.
+    },
+    # Tool #2: Deep Search
+    "deep_search": {
+        "description": "Performs a comprehensive, in-depth search using the Tavily AI search engine. Slower but more thorough. Use for research or complex topics.",
+        "function": tavily_deep_search, # Maps to the tavily_deep_search() function.
+        "params": SearchParams # The schema its parameters are validated against.
+    },
+    # Tool #3: Get Direct Answer
+    "get_direct_answer": {
+        "description": "Searches for a direct, conversational answer to a user's question. Use this when the user asks a direct question like 'What is...?' or 'How do I...?'.",
+        "function": tavily_get_direct_answer, # Maps to the tavily_get_direct_answer() function.
+        "params": SearchParams # The schema its parameters are validated against.
+    },
+    # Tool #4: Domain-Specific Search
+    "search_specific_domains": {
+        "description": "Performs a search focused only on a specific list of domains. Provide the query and a list of websites to search within.",
+        "function": tavily_search_specific_domains, # Maps to the tavily_search_specific_domains() function.
+        "params": DomainSearchParams # The schema its parameters are validated against.
+    }
+}
+
+# The dispatch table used to serve tool calls: each tool name maps straight to its (function, schema)
+# pair, so validating the name and finding everything needed to run it is a single dict lookup.
+_DISPATCH = {name: (tool["function"], tool["params"]) for name, tool in tools.items()}
 
 
 # --- MCP Server Endpoints ---
 # This section defines the web routes (URLs) that the Flask server will respond to.
 
+# The plugin manifest never changes while the server runs, so it is serialized once at startup.
+# Its ETag lets clients and caching proxies revalidate it cheaply instead of downloading it again.
+_PLUGIN_BYTES = orjson.dumps({
+    "schema_version": "v1",
+    "name_for_human": "Tavily Search MCP",
+    "name_for_model": "tavily_search",
+    "description_for_human": "Server for interacting with the Tavily Search API.",
+    "description_for_model": "This server provides tools to search the web using the Tavily AI search engine. Use it to find current information.",
+    "api": {
+        "type": "open_api",
+        "url": "/openapi.yaml" # Points to an OpenAPI spec (optional for this server).
+    }
+})
+_PLUGIN_ETAG = hashlib.md5(_PLUGIN_BYTES).hexdigest()
+_PLUGIN_HEADERS = {"Cache-Control": "public, max-age=86400", "ETag": f'"{_PLUGIN_ETAG}"'}
+
 @app.route('/.well-known/ai-plugin.json', methods=['GET'])
 def get_plugin_info():
     """
     Provides a standard metadata file for AI plugins (like ChatGPT Plugins).
     It describes what the server does in a machine-readable format.
     """
-    return jsonify({
-        "schema_version": "v1",
-        "name_for_human": "Tavily Search MCP",
-        "name_for_model": "tavily_search",
-        "description_for_human": "Server for interacting with the Tavily Search API.",
-        "description_for_model": "This server provides tools to search the web using the Tavily AI search engine. Use it to find current information.",
-        "api": {
-            "type": "open_api",
-            "url": "/openapi.yaml" # Points to an OpenAPI spec (optional for this server).
-        }
-    })
+    # 304 Not Modified: the client already holds this version of the manifest.
+    # If-None-Match uses weak comparison, so tags weakened by a compressing proxy or CDN (W/"...") match too.
+    if request.if_none_match.contains_weak(_PLUGIN_ETAG):
+        return app.response_class(status=304, headers=_PLUGIN_HEADERS)
+    return app.response_class(_PLUGIN_BYTES, mimetype="application/json", headers=_PLUGIN_HEADERS)
+
+def _dispatch(call):
+    """
+    Executes a single tool call of the form {"tool": ..., "params": {...}}.
+    Shared by the single and batch endpoints so both validate and run tools in exactly the same way.
+
+    Returns:
+        A tuple of (JSON body as bytes, HTTP status code).
+    """
+    # Robustness: Each call must be a JSON object before we can look anything up in it.
+    if not isinstance(call, dict):
+        return orjson.dumps({"error": "Each tool call must be a JSON object."}), 400
+
+    # Look up the Python function that implements the requested tool, and the schema for its parameters,
+    # before doing any other work on the call.
+    # The isinstance() check also guards against unhashable names (e.g. a list), which can't be looked up.
+    tool_name = call.get('tool')
+    entry = _DISPATCH.get(tool_name) if isinstance(tool_name, str) else None
+    if entry is None:
+        return orjson.dumps({"error": f"Tool '{tool_name}' not found."}), 404
+    function_to_call, schema = entry
+
+    params = call.get('params', {}) # Parameters for the function call.
+
+    try:
+        # Validate the parameters against the tool's schema (e.g., a missing query or a wrong type).
+        parsed = msgspec.convert(params, schema)
+    except msgspec.ValidationError as e:
+        # Handle cases where the AI provides incorrect parameters, reporting exactly what was wrong.
+        return orjson.dumps({"error": f"Invalid parameters for tool '{tool_name}': {e}"}), 400
+
+    # Call the tool with the validated parameters, passed positionally in the order the schema declares them.
+    return function_to_call(*msgspec.structs.astuple(parsed))
+
+def _parse_json_body():
+    """Parses the raw request body with orjson, returning None if it isn't valid JSON."""
+    # cache=False: the body is parsed exactly once, so there's no need for Flask to keep a copy of it.
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
 
 @app.route('/tools', methods=['POST'])
 def handle_tool_call():
@@ -135,37 +365,70 @@ def handle_tool_call():
     calls the appropriate Python function, and returns the result.
     """
     # Get the JSON data sent by the AI agent.
-    data = request.get_json()
-    tool_name = data.get('tool')
-    params = data.get('params', {}) # Parameters for the function call.
-
-    # Validate that the requested tool exists in our `tools` dictionary.
-    if tool_name not in tools:
-        return jsonify({"error": f"Tool '{tool_name}' not found."}), 404
+    data = _parse_json_body()
+    if data is None:
+        # Robustness: Reject malformed JSON with a clear error instead of a server error.
+        return ojsonify({"error": "Request body must be valid JSON."}), 400
 
-    # Dynamically find the correct Python function to call based on the tool name.
-    function_name = tools[tool_name]['function']
-    function_to_call = globals().get(function_name)
+    # The tool's JSON body is already encoded, so send it as-is.
+    body, status = _dispatch(data)
+    return app.response_class(body, status=status, mimetype="application/json")
 
-    # Ensure the function actually exists in the code.
-    if not function_to_call:
-        return jsonify({"error": f"Function implementation for '{tool_name}' not found."}), 500
+# --- Batch Tool Calls ---
+# The largest number of tool calls accepted in a single /tools/batch request.
+MAX_BATCH_CALLS = 20
 
+def _dispatch_safe(call):
+    """
+    Runs _dispatch(), turning any unexpected exception into an error entry for that call,
+    so that one failing call can't take down the other results of its batch.
+    """
     try:
-        # The core of the dynamic dispatch: call the found function with the provided parameters.
-        # The `**params` syntax unpacks the dictionary of parameters into keyword arguments.
-        result = function_to_call(**params)
-        return jsonify(result)
-    except TypeError as e:
-        # Handle cases where the AI provides incorrect parameters (e.g., wrong name or type).
-        return jsonify({"error": f"Invalid parameters for tool '{tool_name}': {e}"}), 400
+        return _dispatch(call)
+    except Exception:
+        # Robustness: Report the failure in this call's slot; the rest of the batch is unaffected.
+        app.logger.exception("Tool call in batch failed")
+        return orjson.dumps({"error": "Internal error while running tool."}), 500
+
+@app.route('/tools/batch', methods=['POST'])
+def handle_tool_batch():
+    """
+    Executes several independent tool calls in one request: {"calls": [{"tool": ..., "params": ...}, ...]}.
+    The calls run concurrently, so the batch takes about as long as its slowest call rather than the sum of all of them.
+    Returns a list of results in the same order as the calls; a call that fails has an "error" entry in its place.
+    """
+    data = _parse_json_body()
+    if data is None:
+        return ojsonify({"error": "Request body must be valid JSON."}), 400
+
+    calls = data.get('calls') if isinstance(data, dict) else None
+    if not isinstance(calls, list):
+        return ojsonify({"error": "Request body must contain a 'calls' list."}), 400
+    if len(calls) > MAX_BATCH_CALLS:
+        return ojsonify({"error": f"A batch may contain at most {MAX_BATCH_CALLS} calls."}), 400
+
+    # Run every call in its own greenlet; Pool.map() returns the results in input order.
+    results = Pool(MAX_BATCH_CALLS).map(_dispatch_safe, calls)
+    # Every result is already an encoded JSON body, so the response is assembled without re-encoding them.
+    body = b"[" + b",".join(result for result, _status in results) + b"]"
+    return app.response_class(body, mimetype="application/json")
 
 
 # --- Main Execution Block ---
 # This standard Python construct ensures that the Flask development server runs only when the script
 # is executed directly (e.g., `python tavily_server.py`), not when it's imported as a module.
+#
+# In production, serve the app with gunicorn and gevent workers instead:
+#   gunicorn -k gevent -w 4 --worker-connections 1000 travily_server:app --bind 0.0.0.0:3434
 if __name__ == '__main__':
-    # Starts the Flask development server.
-    # port=3434: Specifies the port number.
-    # debug=True: Enables debug mode, which provides detailed error pages and auto-reloads the server on code changes.
-    app.run(port=3434, debug=True)
+    if os.environ.get("DEV"):
+        # Starts the Flask development server.
+        # port=3434: Specifies the port number.
+        # debug=True: Enables debug mode, which provides detailed error pages and auto-reloads the server on code changes.
+        app.run(port=3434, debug=True)
+    else:
+        # The development server handles one request at a time, so refuse to use it outside of development.
+        raise SystemExit(
+            "Set DEV=1 to run the development server, or start the production server with:\n"
+            "  gunicorn -k gevent -w 4 --worker-connections 1000 travily_server:app --bind 0.0.0.0:3434"
+        )